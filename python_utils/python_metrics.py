@@ -3,6 +3,8 @@ from typing import Any, Dict
 from repominer.metrics.base import BaseMetricsExtractor
 
 class PythonMetricsExtractor(BaseMetricsExtractor):
+    # Suffixes of the files to extract metrics from
+    PYTHON_EXTENSIONS = ('.py',)
 
     def __init__(self, path_to_repo: str, clone_repo_to: str = None, at: str = 'release'):
         super().__init__(path_to_repo, clone_repo_to, at)
@@ -11,4 +13,4 @@ class PythonMetricsExtractor(BaseMetricsExtractor):
         return super().get_product_metrics(script)
 
     def ignore_file(self, path_to_file: str, content: str = None):
-        return not path_to_file.endswith('.py')
\ No newline at end of file
+        return not path_to_file.endswith(self.PYTHON_EXTENSIONS)
\ No newline at end of file
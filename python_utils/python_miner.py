@@ -1,30 +1,51 @@
+import re
+import subprocess
+
 from typing import List
 from repominer.mining.base import BaseMiner, FixingCommitClassifier
 from repominer import filters
 
-from pydriller.repository import Repository, Commit
+from pydriller.repository import Commit
 from pydriller.domain.commit import Commit, ModificationType
+
+commit_hash_pattern = re.compile(rb'[0-9a-f]{40}')
 class PythonMiner(BaseMiner):
+    # Suffixes of the files to mine. A tuple, as str.endswith accepts one directly
+    PYTHON_EXTENSIONS = ('.py',)
+
     def __init__(self, url_to_repo, clone_repo_to, branch):
         super().__init__(url_to_repo, clone_repo_to, branch)
         self.FixingCommitClassifier = PythonFixingCommitClassifier
     
     def discard_undesired_fixing_commits(self, commits: List[str]) -> None:
+        if not commits:
+            return
+
         self.sort_commits(commits)
 
-        for commit in Repository(self.path_to_repo, from_commit=commits[0], to_commit=commits[-1]).traverse_commits():
-            i = 0
-            while i < len(commit.modified_files) and commit.modified_files[i].change_type == ModificationType.MODIFY and commit.modified_files[i].new_path.endswith('.py'):
-                i += 1
-            if i >= len(commit.modified_files):
-                try:
-                    commits.remove(commit.hash)
-                except:
-                    pass
-        #pass
+        # Ask git for the name-status of the candidate commits only, and scan the raw
+        # bytes: deciding keep/discard needs nothing but the 'M<TAB>path' lines and the
+        # .py suffix, so no ModifiedFile objects are built and paths are never decoded.
+        # Quoted paths (special characters) end with '.py"' instead of '.py'
+        log_output = subprocess.run(
+            ['git', '-C', self.path_to_repo, 'log', '--no-walk=unsorted', '--stdin',
+             '--name-status', '--format=%H'],
+            input='\n'.join(commits).encode(), capture_output=True, check=True).stdout
+
+        keep = set()
+        current_hash = None
+
+        for line in log_output.splitlines():
+            if line.startswith(b'M\t'):
+                if current_hash and line.endswith((b'.py', b'.py"')):
+                    keep.add(current_hash)
+            elif commit_hash_pattern.fullmatch(line):
+                current_hash = line.decode()
+
+        commits[:] = [sha for sha in commits if sha in keep]
 
     def ignore_file(self, path_to_file: str, content: str = None):
-        return not path_to_file.endswith('.py')
+        return not path_to_file.endswith(self.PYTHON_EXTENSIONS)
     
 class PythonFixingCommitClassifier(FixingCommitClassifier):
     def __init__(self, commit: Commit):
@@ -223,6 +223,10 @@ class BaseMetricsExtractor:
             Whether to extract delta metrics between two successive releases or commits.
 
         """
+        # label() yields lazily; consume the generator exactly once so that the repeated
+        # membership tests below do not silently exhaust it
+        labeled_files = list(labeled_files)
+
         self.dataset = pd.DataFrame()
         git_repo = Git(self.path_to_repo)
 
@@ -1,7 +1,13 @@
+import math
 import os
 import nltk
 import re
+import subprocess
+import threading
+import time
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cached_property
 from typing import Dict, Generator, List
 
 from pydriller.domain.commit import Commit, ModificationType
@@ -22,8 +28,112 @@ try:
 except LookupError:
     nltk.download('stopwords')
 
+from nltk.corpus import stopwords
+
 # Constants
 full_name_pattern = re.compile(r'(github|gitlab){1}\.com/([\w\W]+)$')
+commit_hash_pattern = re.compile(r'^[0-9a-f]{40}$')
+
+# NLP resources are loaded once at import time. Re-loading them per commit (e.g., through
+# nltk.sent_tokenize, which resolves the punkt loader on every call) is needlessly expensive.
+STOPWORDS = frozenset(stopwords.words('english'))
+_sent_tokenize = nltk.data.load('tokenizers/punkt/english.pickle').tokenize
+_word_tokenize = nltk.tokenize.TreebankWordTokenizer().tokenize
+
+
+def _open_git(path_to_repo: str) -> Git:
+    """
+    Construct a pydriller Git handle, retrying while concurrent constructions race on
+    the repository's config lock.
+
+    PyDriller's Git constructor writes a blame option to .git/config, and GitPython
+    raises OSError when .git/config.lock is already held instead of waiting for it.
+    With several workers opening the same repository at once, construction must be
+    retried until the lock is free.
+
+    Parameters
+    ----------
+    path_to_repo : str
+        Path to the local repository.
+
+    Returns
+    -------
+    Git
+        The Git handle.
+
+    """
+    last_error = None
+
+    for _ in range(50):
+        try:
+            return Git(path_to_repo)
+        except OSError as error:
+            last_error = error
+            time.sleep(0.1)
+
+    raise last_error
+
+
+def _classify_commits(path_to_repo: str, hashes: List[str], classifier_class) -> Dict[str, List[str]]:
+    """
+    Classify a batch of commits and return their fixing labels.
+
+    This is a module-level function so that it can be dispatched to worker processes.
+    Each worker opens its own Git handle to avoid sharing a git instance across processes.
+
+    Parameters
+    ----------
+    path_to_repo : str
+        Path to the local repository.
+
+    hashes : List[str]
+        The commit hashes to classify.
+
+    classifier_class
+        The FixingCommitClassifier (sub)class to instantiate per commit.
+
+    Returns
+    -------
+    Dict[str, List[str]]
+        A dictionary of commit hashes and their fixing labels, for commits with at least one label.
+
+    """
+    git_repo = _open_git(path_to_repo)
+    commits_labels = {}
+
+    for sha in hashes:
+        commit = git_repo.get_commit(sha)
+
+        # Cheap prefilter: every fixes_* rule requires a defect keyword in some sentence,
+        # and a keyword in a sentence is necessarily a substring of the raw message.
+        # Most commits have none, and can be rejected before any tokenization runs
+        if not rules.has_defect_pattern(commit.msg):
+            continue
+
+        fcc = classifier_class(commit)
+
+        labels = []
+        if fcc.fixes_conditional():
+            labels.append('CONDITIONAL')
+        if fcc.fixes_configuration_data():
+            labels.append('CONFIGURATION_DATA')
+        if fcc.fixes_dependency():
+            labels.append('DEPENDENCY')
+        if fcc.fixes_documentation():
+            labels.append('DOCUMENTATION')
+        if fcc.fixes_idempotency():
+            labels.append('IDEMPOTENCY')
+        if fcc.fixes_security():
+            labels.append('SECURITY')
+        if fcc.fixes_service():
+            labels.append('SERVICE')
+        if fcc.fixes_syntax():
+            labels.append('SYNTAX')
+
+        if labels:
+            commits_labels[sha] = labels
+
+    return commits_labels
 
 
 class BaseMiner:
@@ -67,6 +177,8 @@ class BaseMiner:
 
         commit_hashes : List[str]
             List of commit hash on the repository's branch, ordered by creation date.
+            It is computed lazily, on first access, so that constructing a miner and
+            seeding ``fixing_commits`` stays cheap.
 
         fixing_commits : List[str]
             List of bug-fixing commit hashes.
@@ -113,20 +225,33 @@ class BaseMiner:
         self.path_to_repo = os.path.join(clone_repo_to, full_name_match.groups()[1].split('/')[1])
         self.branch = branch
 
+        self._url_to_repo = url_to_repo
+        self._clone_repo_to = clone_repo_to
+
         self.fixing_commits = list()
         self.fixed_files = list()
 
-        # Get all the repository commits sorted by commit date
-        self.commit_hashes = [c.hash for c in
-                              Repository(
-                                  path_to_repo=self.path_to_repo if os.path.isdir(self.path_to_repo) else url_to_repo,
-                                  clone_repo_to=clone_repo_to,
-                                  only_in_branch=self.branch,
-                                  order='date-order',
-                                  num_workers=1).traverse_commits()]
-
         self.FixingCommitClassifier = FixingCommitClassifier
 
+    @cached_property
+    def commit_hashes(self) -> List[str]:
+        # All the repository commits sorted by commit date. Traversing the repository
+        # (and possibly cloning it) is deferred to the first access
+        path_exists = os.path.isdir(self.path_to_repo)
+
+        return [c.hash for c in
+                Repository(
+                    path_to_repo=self.path_to_repo if path_exists else self._url_to_repo,
+                    clone_repo_to=self._clone_repo_to,
+                    only_in_branch=self.branch,
+                    order='date-order',
+                    num_workers=1).traverse_commits()]
+
+    @cached_property
+    def _hash_to_idx(self) -> Dict[str, int]:
+        # Map hash -> position in commit_hashes for O(1) lookups, instead of list.index()
+        return {sha: idx for idx, sha in enumerate(self.commit_hashes)}
+
     def discard_undesired_fixing_commits(self, commits: List[str]) -> None:
         """
         Discard undesired commits.
@@ -149,23 +274,30 @@ class BaseMiner:
 
         self.sort_commits(commits)
 
+        commits_set = set(commits)
+
         for commit in Repository(self.path_to_repo,
                                  from_commit=commits[0],  # first commit in commits
                                  to_commit=commits[-1],  # last commit in commits
                                  only_in_branch=self.branch).traverse_commits():
-            i = 0
-
-            # if none of the modified files is a Ansible file then discard the commit
-            while i < len(commit.modified_files):
-                if commit.modified_files[i].change_type != ModificationType.MODIFY:
-                    i += 1
-                elif self.ignore_file(commit.modified_files[i].new_path, commit.modified_files[i].source_code):
-                    i += 1
-                else:
+
+            # The first desired modified file decides whether the commit is kept, so stop
+            # iterating as soon as one is found. If none is found (e.g., none of the
+            # modified files is an Ansible file) then discard the commit
+            keep = False
+
+            for modified_file in commit.modified_files:
+                if modified_file.change_type != ModificationType.MODIFY:
+                    continue
+
+                if not self.ignore_file(modified_file.new_path, modified_file.source_code):
+                    keep = True
                     break
 
-            if i == len(commit.modified_files) and commit.hash in commits:
-                commits.remove(commit.hash)
+            if not keep:
+                commits_set.discard(commit.hash)
+
+        commits[:] = [sha for sha in commits if sha in commits_set]
 
     def get_fixing_commits(self, num_workers=8) -> Dict[str, List[str]]:
         """
@@ -178,7 +310,7 @@ class BaseMiner:
         Parameters
         ----------
         num_workers : int
-            Number of threads. Default 8.
+            Number of worker processes. Default 8.
 
         Returns
         -------
@@ -187,35 +319,30 @@ class BaseMiner:
             {'hash1': ['SERVICE', 'SYNTAX', ...]}
         """
 
+        fixing_commits = set(self.fixing_commits)
+        candidates = [sha for sha in self.commit_hashes if sha not in fixing_commits]
+
         commits_labels = {}
-        commits = []
 
-        for commit in Repository(self.path_to_repo, only_in_branch=self.branch, num_workers=num_workers).traverse_commits():
+        if candidates:
+            if num_workers > 1 and len(candidates) > 1:
+                # Classify batches of commits in parallel. The NLP-based classification is
+                # CPU-bound, so processes are used rather than threads
+                batch_size = math.ceil(len(candidates) / num_workers)
+                batches = [candidates[i:i + batch_size] for i in range(0, len(candidates), batch_size)]
 
-            if commit.hash in self.fixing_commits:
-                continue
+                with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                    futures = [executor.submit(_classify_commits, self.path_to_repo, batch,
+                                               self.FixingCommitClassifier)
+                               for batch in batches]
+
+                    for future in futures:
+                        commits_labels.update(future.result())
+            else:
+                commits_labels = _classify_commits(self.path_to_repo, candidates, self.FixingCommitClassifier)
 
-            fcc = self.FixingCommitClassifier(commit)
-
-            if fcc.fixes_conditional():
-                commits_labels.setdefault(commit.hash, []).append('CONDITIONAL')
-            if fcc.fixes_configuration_data():
-                commits_labels.setdefault(commit.hash, []).append('CONFIGURATION_DATA')
-            if fcc.fixes_dependency():
-                commits_labels.setdefault(commit.hash, []).append('DEPENDENCY')
-            if fcc.fixes_documentation():
-                commits_labels.setdefault(commit.hash, []).append('DOCUMENTATION')
-            if fcc.fixes_idempotency():
-                commits_labels.setdefault(commit.hash, []).append('IDEMPOTENCY')
-            if fcc.fixes_security():
-                commits_labels.setdefault(commit.hash, []).append('SECURITY')
-            if fcc.fixes_service():
-                commits_labels.setdefault(commit.hash, []).append('SERVICE')
-            if fcc.fixes_syntax():
-                commits_labels.setdefault(commit.hash, []).append('SYNTAX')
-
-            if commit.hash in commits_labels:
-                commits.append(commit.hash)
+        # Candidates are already in ascending order of date
+        commits = [sha for sha in candidates if sha in commits_labels]
 
         if commits:
             # Discard commits that do not touch IaC files
@@ -227,8 +354,9 @@ class BaseMiner:
             # Sort fixing_commits in ascending order of date
             self.sort_commits(self.fixing_commits)
 
+            kept = set(commits)
             for sha in list(commits_labels.keys()):
-                if sha not in commits:  # It means it was an undesired commit
+                if sha not in kept:  # It means it was an undesired commit
                     del commits_labels[sha]
 
         return commits_labels
@@ -260,7 +388,26 @@ class BaseMiner:
 
         self.fixed_files = list()
         renamed_files = dict()
-        git_repo = Git(self.path_to_repo)
+
+        # First FixedFile seen for each filepath, to avoid linear scans of the growing
+        # fixed_files list (FixedFile equality is based on the filepath only)
+        fixed_files_by_path = dict()
+
+        fixing_commits = set(self.fixing_commits)
+
+        # The SZZ lookups spend their time in git subprocesses, which release the GIL, so
+        # a small thread pool helps. Each thread uses its own Git handle, as the
+        # underlying git wrapper is not safe to share across threads. Construction is
+        # serialized: the Git constructor writes to .git/config, and concurrent writers
+        # fail on the config lock
+        thread_local = threading.local()
+        git_handle_lock = threading.Lock()
+
+        def commits_last_modified_lines(args):
+            if not hasattr(thread_local, 'git_repo'):
+                with git_handle_lock:
+                    thread_local.git_repo = Git(self.path_to_repo)
+            return thread_local.git_repo.get_commits_last_modified_lines(*args)
 
         if len(self.fixing_commits) == 1:
             repository_mining = Repository(self.path_to_repo, single=self.fixing_commits[0], only_in_branch=self.branch,
@@ -274,65 +421,78 @@ class BaseMiner:
                                            num_workers=1)
 
         # Traverse commits from the latest to the first fixing-commit
-        for commit in repository_mining.traverse_commits():
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for commit in repository_mining.traverse_commits():
 
-            for modified_file in commit.modified_files:
+                to_process = []
 
-                # Not interested in ADDED and DELETED files
-                if modified_file.change_type not in (ModificationType.MODIFY, ModificationType.RENAME):
-                    continue
+                for modified_file in commit.modified_files:
 
-                # If RENAMED then handle renaming
-                if modified_file.change_type == ModificationType.RENAME:
-                    # if modified_file.new_path in renamed_files:
-                    #     renamed_files[modified_file.old_path] = renamed_files[modified_file.new_path]
-                    # else:
-                    renamed_files[modified_file.old_path] = renamed_files.get(modified_file.new_path,
-                                                                              modified_file.new_path)
-                    # elif commit.hash in self.fixing_commits:
-                    #     renamed_files[modified_file.old_path] = modified_file.new_path
-
-                # This is to ensure that renamed files are tracked. Then, if the commit is not a fixing-commit then
-                # go to the next (previous commit in chronological order)
-                if commit.hash not in self.fixing_commits:
-                    continue
+                    # Not interested in ADDED and DELETED files
+                    if modified_file.change_type not in (ModificationType.MODIFY, ModificationType.RENAME):
+                        continue
 
-                # Not interested in type of files
-                if self.ignore_file(modified_file.new_path, modified_file.source_code):
-                    continue
+                    # If RENAMED then handle renaming
+                    if modified_file.change_type == ModificationType.RENAME:
+                        # if modified_file.new_path in renamed_files:
+                        #     renamed_files[modified_file.old_path] = renamed_files[modified_file.new_path]
+                        # else:
+                        renamed_files[modified_file.old_path] = renamed_files.get(modified_file.new_path,
+                                                                                  modified_file.new_path)
+                        # elif commit.hash in self.fixing_commits:
+                        #     renamed_files[modified_file.old_path] = modified_file.new_path
+
+                    # This is to ensure that renamed files are tracked. Then, if the commit is not a fixing-commit then
+                    # go to the next (previous commit in chronological order)
+                    if commit.hash not in fixing_commits:
+                        continue
 
-                # Identify bug-inducing commits. Dict[modified_file, Set[commit_hashes]]
-                bug_inducing_commits = git_repo.get_commits_last_modified_lines(commit, modified_file)
+                    # Not interested in type of files
+                    if self.ignore_file(modified_file.new_path, modified_file.source_code):
+                        continue
 
-                if not bug_inducing_commits.get(modified_file.new_path):
+                    to_process.append(modified_file)
+
+                if not to_process:
                     continue
-                else:
-                    bug_inducing_commits = list(bug_inducing_commits[modified_file.new_path])
-                    self.sort_commits(bug_inducing_commits)
-                    bic = bug_inducing_commits[0]  # bic is the oldest bug-inducing-commit
-
-                current_fix = FixedFile(filepath=renamed_files.get(modified_file.new_path, modified_file.new_path),
-                                        bic=bic,
-                                        fic=commit.hash)
-
-                if current_fix not in self.fixed_files:
-                    self.fixed_files.append(current_fix)
-                else:
-                    idx = self.fixed_files.index(current_fix)
-                    existing_fix = self.fixed_files[idx]
-
-                    # If the current FIC is older than the existing bic, then save it as a new FixedFile.
-                    # Else it means the current fix is between the existing fix bic and fic.
-                    # If the current BIC is older than the existing bic, then update the bic.
-                    if self.commit_hashes.index(current_fix.fic) < self.commit_hashes.index(existing_fix.bic):
-
-                        if modified_file.new_path in renamed_files:
-                            del renamed_files[modified_file.new_path]
-
-                        current_fix.filepath = modified_file.new_path
+
+                # Identify bug-inducing commits concurrently. Dict[modified_file, Set[commit_hashes]]
+                # The bic selection below stays sequential and in the original file order
+                results = executor.map(commits_last_modified_lines,
+                                       [(commit, modified_file) for modified_file in to_process])
+
+                for modified_file, bug_inducing_commits in zip(to_process, results):
+
+                    if not bug_inducing_commits.get(modified_file.new_path):
+                        continue
+                    else:
+                        bug_inducing_commits = list(bug_inducing_commits[modified_file.new_path])
+                        self.sort_commits(bug_inducing_commits)
+                        bic = bug_inducing_commits[0]  # bic is the oldest bug-inducing-commit
+
+                    current_fix = FixedFile(filepath=renamed_files.get(modified_file.new_path, modified_file.new_path),
+                                            bic=bic,
+                                            fic=commit.hash)
+
+                    existing_fix = fixed_files_by_path.get(current_fix.filepath)
+
+                    if existing_fix is None:
                         self.fixed_files.append(current_fix)
-                    elif self.commit_hashes.index(current_fix.bic) < self.commit_hashes.index(existing_fix.bic):
-                        existing_fix.bic = current_fix.bic
+                        fixed_files_by_path[current_fix.filepath] = current_fix
+                    else:
+                        # If the current FIC is older than the existing bic, then save it as a new FixedFile.
+                        # Else it means the current fix is between the existing fix bic and fic.
+                        # If the current BIC is older than the existing bic, then update the bic.
+                        if self._hash_to_idx[current_fix.fic] < self._hash_to_idx[existing_fix.bic]:
+
+                            if modified_file.new_path in renamed_files:
+                                del renamed_files[modified_file.new_path]
+
+                            current_fix.filepath = modified_file.new_path
+                            self.fixed_files.append(current_fix)
+                            fixed_files_by_path.setdefault(current_fix.filepath, current_fix)
+                        elif self._hash_to_idx[current_fix.bic] < self._hash_to_idx[existing_fix.bic]:
+                            existing_fix.bic = current_fix.bic
 
     def ignore_file(self, path_to_file: str, content: str = None) -> bool:
         """
@@ -377,33 +537,44 @@ class BaseMiner:
         if not (self.fixing_commits and self.fixed_files):
             return
 
-        labeling = dict()
-        for file in self.fixed_files:
-            labeling.setdefault(file.filepath, list()).append(file)
-
         self.sort_commits(self.fixing_commits)
 
         renamed_files = {}
 
-        for commit in Repository(self.path_to_repo, from_commit=self.fixing_commits[-1],
-                                 to_commit=self.commit_hashes[0],
-                                 order='reverse', num_workers=1).traverse_commits():
+        # Resolve each file's fixing/bug-introducing positions once, not per commit
+        file_ranges = [(self._hash_to_idx[file.fic], self._hash_to_idx[file.bic], file)
+                       for file in self.fixed_files]
 
-            for file in self.fixed_files:
+        # Only the commit hashes and the renames are needed here, so the range is walked
+        # with a single git log call rather than one PyDriller Commit object per step.
+        # The output lists commits from the last fixing-commit backwards, each hash
+        # followed by the name-status lines of its diff (R<score>\told\tnew for renames).
+        # quotepath is turned off so that non-ASCII paths come out verbatim, as PyDriller
+        # reports them, instead of quoted and octal-escaped
+        log_output = subprocess.run(
+            ['git', '-C', self.path_to_repo, '-c', 'core.quotepath=off', 'log',
+             '--find-renames', '--name-status', '--format=%H', self.fixing_commits[-1]],
+            capture_output=True, text=True, check=True).stdout
 
-                idx_fic = self.commit_hashes.index(file.fic)
-                idx_bic = self.commit_hashes.index(file.bic)
-                idx_commit = self.commit_hashes.index(commit.hash)
+        for line in log_output.splitlines():
 
-                if idx_fic > idx_commit >= idx_bic:
-                    yield FailureProneFile(filepath=renamed_files.get(file.filepath, file.filepath),
-                                           commit=commit.hash,
-                                           fixing_commit=file.fic)
+            if not line:
+                continue
+
+            if commit_hash_pattern.match(line):
+                idx_commit = self._hash_to_idx[line]
+
+                for idx_fic, idx_bic, file in file_ranges:
+
+                    if idx_fic > idx_commit >= idx_bic:
+                        yield FailureProneFile(filepath=renamed_files.get(file.filepath, file.filepath),
+                                               commit=line,
+                                               fixing_commit=file.fic)
 
             # Handle file renaming
-            for modified_file in commit.modified_files:
-                if modified_file.change_type == ModificationType.RENAME:
-                    renamed_files[modified_file.new_path] = modified_file.old_path
+            elif line.startswith('R'):
+                _, old_path, new_path = line.split('\t')
+                renamed_files[new_path] = old_path
 
     def sort_commits(self, commits: List[str]) -> None:
         """
@@ -415,7 +586,8 @@ class BaseMiner:
             List of commits hash to sort.
 
         """
-        sorted_commits = [sha for sha in self.commit_hashes if sha in commits]
+        sorted_commits = sorted((sha for sha in commits if sha in self._hash_to_idx),
+                                key=self._hash_to_idx.get)
         commits.clear()
         commits.extend(sorted_commits)
 
@@ -448,15 +620,32 @@ class FixingCommitClassifier:
         self.commit = commit
         self.sentences = []  # will be list of tokens list
 
-        for sentence in nltk.sent_tokenize(commit.msg):
+        for sentence in _sent_tokenize(commit.msg):
             # split into words
-            tokens = nltk.tokenize.word_tokenize(sentence)
+            tokens = _word_tokenize(sentence)
 
-            # remove all tokens that are not alphabetic
-            tokens = [word.strip() for word in tokens if word.isalpha()]
+            # remove all tokens that are not alphabetic. No strip() needed: a token
+            # passing isalpha() cannot carry whitespace
+            tokens = list(filter(str.isalpha, tokens))
 
             self.sentences.append(tokens)
 
+        # Pre-compute what every fixes_* method needs, so the (expensive) NLP work
+        # is done at most once per sentence rather than once per rule check
+        self._sentence_strs = [' '.join(tokens) for tokens in self.sentences]
+        self._has_defect = [rules.has_defect_pattern(sentence) for sentence in self._sentence_strs]
+        self._sentence_deps = [None] * len(self._sentence_strs)
+        self._comment_changed = None
+
+    def _sentence_dep(self, index: int) -> str:
+        """
+        Return the head dependents of the index-th sentence, computing them on first access.
+        """
+        if self._sentence_deps[index] is None:
+            self._sentence_deps[index] = ' '.join(utils.get_head_dependents(self._sentence_strs[index]))
+
+        return self._sentence_deps[index]
+
     def is_comment_changed(self) -> bool:
         """
         Return True if the commit fixes a comment.
@@ -467,16 +656,23 @@ class FixingCommitClassifier:
             True if the commit modifies a comment
 
         """
-        for modified_file in self.commit.modified_files:
-            if modified_file.change_type != ModificationType.MODIFY:
-                continue
+        if self._comment_changed is None:
+            # Parsing the diffs is expensive and the commit does not change, so the
+            # result is computed once and cached across calls
+            self._comment_changed = False
 
-            diff = [line.strip() for _, line in modified_file.diff_parsed.get('added', {})]
-            diff.extend([line.strip() for _, line in modified_file.diff_parsed.get('deleted', {})])
-            if any(line.startswith('#') for line in diff):
-                return True
+            for modified_file in self.commit.modified_files:
+                if modified_file.change_type != ModificationType.MODIFY:
+                    continue
 
-        return False
+                diff_parsed = modified_file.diff_parsed
+                diff = [line.strip() for _, line in diff_parsed.get('added', {})]
+                diff.extend([line.strip() for _, line in diff_parsed.get('deleted', {})])
+                if any(line.startswith('#') for line in diff):
+                    self._comment_changed = True
+                    break
+
+        return self._comment_changed
 
     def is_data_changed(self) -> bool:
         return False
@@ -497,10 +693,8 @@ class FixingCommitClassifier:
             True if the commit fixes a conditional. False, otherwise.
 
         """
-        for sentence in self.sentences:
-            sentence = ' '.join(sentence)
-            sentence_dep = ' '.join(utils.get_head_dependents(sentence))
-            if rules.has_defect_pattern(sentence) and rules.has_conditional_pattern(sentence_dep):
+        for i in range(len(self.sentences)):
+            if self._has_defect[i] and rules.has_conditional_pattern(self._sentence_dep(i)):
                 return True
 
         return False
@@ -516,17 +710,18 @@ class FixingCommitClassifier:
 
         """
 
-        for sentence in self.sentences:
-            sentence = ' '.join(sentence)
-            sentence_dep = ' '.join(utils.get_head_dependents(sentence))
+        for i in range(len(self.sentences)):
+            if not self._has_defect[i]:
+                continue
+
+            sentence_dep = self._sentence_dep(i)
 
-            if rules.has_defect_pattern(sentence) \
-                    and (rules.has_storage_configuration_pattern(sentence_dep)
-                         or rules.has_file_configuration_pattern(sentence_dep)
-                         or rules.has_network_configuration_pattern(sentence_dep)
-                         or rules.has_user_configuration_pattern(sentence_dep)
-                         or rules.has_cache_configuration_pattern(sentence_dep)
-                         or self.is_data_changed()):
+            if rules.has_storage_configuration_pattern(sentence_dep) \
+                    or rules.has_file_configuration_pattern(sentence_dep) \
+                    or rules.has_network_configuration_pattern(sentence_dep) \
+                    or rules.has_user_configuration_pattern(sentence_dep) \
+                    or rules.has_cache_configuration_pattern(sentence_dep) \
+                    or self.is_data_changed():
                 return True
 
         return False
@@ -543,11 +738,9 @@ class FixingCommitClassifier:
 
         """
 
-        for sentence in self.sentences:
-            sentence = ' '.join(sentence)
-            sentence_dep = ' '.join(utils.get_head_dependents(sentence))
-            if rules.has_defect_pattern(sentence) and (
-                    rules.has_dependency_pattern(sentence_dep) or self.is_include_changed()):
+        for i in range(len(self.sentences)):
+            if self._has_defect[i] and (
+                    rules.has_dependency_pattern(self._sentence_dep(i)) or self.is_include_changed()):
                 return True
 
         return False
@@ -563,11 +756,9 @@ class FixingCommitClassifier:
 
         """
 
-        for sentence in self.sentences:
-            sentence = ' '.join(sentence)
-            sentence_dep = ' '.join(utils.get_head_dependents(sentence))
-            if rules.has_defect_pattern(sentence) and (
-                    rules.has_documentation_pattern(sentence_dep) or self.is_comment_changed()):
+        for i in range(len(self.sentences)):
+            if self._has_defect[i] and (
+                    rules.has_documentation_pattern(self._sentence_dep(i)) or self.is_comment_changed()):
                 return True
 
         return False
@@ -583,10 +774,8 @@ class FixingCommitClassifier:
 
         """
 
-        for sentence in self.sentences:
-            sentence = ' '.join(sentence)
-            sentence_dep = ' '.join(utils.get_head_dependents(sentence))
-            if rules.has_defect_pattern(sentence) and rules.has_idempotency_pattern(sentence_dep):
+        for i in range(len(self.sentences)):
+            if self._has_defect[i] and rules.has_idempotency_pattern(self._sentence_dep(i)):
                 return True
 
         return False
@@ -602,10 +791,8 @@ class FixingCommitClassifier:
 
         """
 
-        for sentence in self.sentences:
-            sentence = ' '.join(sentence)
-            sentence_dep = ' '.join(utils.get_head_dependents(sentence))
-            if rules.has_defect_pattern(sentence) and rules.has_security_pattern(sentence_dep):
+        for i in range(len(self.sentences)):
+            if self._has_defect[i] and rules.has_security_pattern(self._sentence_dep(i)):
                 return True
 
         return False
@@ -621,11 +808,9 @@ class FixingCommitClassifier:
 
         """
 
-        for sentence in self.sentences:
-            sentence = ' '.join(sentence)
-            sentence_dep = ' '.join(utils.get_head_dependents(sentence))
-            if rules.has_defect_pattern(sentence) and (
-                    rules.has_service_pattern(sentence_dep) or self.is_service_changed()):
+        for i in range(len(self.sentences)):
+            if self._has_defect[i] and (
+                    rules.has_service_pattern(self._sentence_dep(i)) or self.is_service_changed()):
                 return True
 
         return False
@@ -641,10 +826,8 @@ class FixingCommitClassifier:
 
         """
 
-        for sentence in self.sentences:
-            sentence = ' '.join(sentence)
-            sentence_dep = ' '.join(utils.get_head_dependents(sentence))
-            if rules.has_defect_pattern(sentence) and rules.has_syntax_pattern(sentence_dep):
+        for i in range(len(self.sentences)):
+            if self._has_defect[i] and rules.has_syntax_pattern(self._sentence_dep(i)):
                 return True
 
         return False
@@ -1,31 +1,46 @@
+# Keyword patterns are defined once at module level, and each matcher lowercases the
+# text a single time: these functions run on every sentence of every commit message.
+DEFECT_PATTERN = ('error', 'bug', 'fix', 'issu', 'mistake', 'incorrect', 'fault', 'defect', 'flaw')
+CONDITIONAL_PATTERN = ('logic', 'condit', 'boolean')
+STORAGE_CONFIGURATION_PATTERN = ('sql', 'db', 'databas')
+FILE_CONFIGURATION_PATTERN = ('file', 'permiss')
+NETWORK_CONFIGURATION_PATTERN = ('network', 'ip', 'address', 'port', 'tcp', 'dhcp')
+USER_CONFIGURATION_PATTERN = ('user', 'usernam', 'password')
+DEPENDENCY_PATTERN = ('requir', 'depend', 'relat', 'order', 'sync', 'compat', 'ensur', 'inherit')
+DOCUMENTATION_PATTERN = ('doc', 'comment', 'spec', 'licens', 'copyright', 'notic', 'header', 'readm')
+SECURITY_PATTERN = ('vul', 'ssl', 'secr', 'authent', 'password', 'secur', 'cve')
+SERVICE_PATTERN = ('servic', 'server')
+SYNTAX_PATTERN = ('compil', 'lint', 'warn', 'typo', 'spell', 'indent', 'regex', 'variabl', 'whitespac')
+
+
 def has_defect_pattern(text: str) -> bool:
-    string_pattern = ['error', 'bug', 'fix', 'issu', 'mistake', 'incorrect', 'fault', 'defect', 'flaw']
-    return any(word in text.lower() for word in string_pattern)
+    text = text.lower()
+    return any(word in text for word in DEFECT_PATTERN)
 
 
 def has_conditional_pattern(text: str) -> bool:
-    string_pattern = ['logic', 'condit', 'boolean']
-    return any(word in text.lower() for word in string_pattern)
+    text = text.lower()
+    return any(word in text for word in CONDITIONAL_PATTERN)
 
 
 def has_storage_configuration_pattern(text: str) -> bool:
-    string_pattern = ['sql', 'db', 'databas']
-    return any(word in text.lower() for word in string_pattern)
+    text = text.lower()
+    return any(word in text for word in STORAGE_CONFIGURATION_PATTERN)
 
 
 def has_file_configuration_pattern(text: str) -> bool:
-    string_pattern = ['file', 'permiss']
-    return any(word in text.lower() for word in string_pattern)
+    text = text.lower()
+    return any(word in text for word in FILE_CONFIGURATION_PATTERN)
 
 
 def has_network_configuration_pattern(text: str) -> bool:
-    string_pattern = ['network', 'ip', 'address', 'port', 'tcp', 'dhcp']
-    return any(word in text.lower() for word in string_pattern)
+    text = text.lower()
+    return any(word in text for word in NETWORK_CONFIGURATION_PATTERN)
 
 
 def has_user_configuration_pattern(text: str) -> bool:
-    string_pattern = ['user', 'usernam', 'password']
-    return any(word in text.lower() for word in string_pattern)
+    text = text.lower()
+    return any(word in text for word in USER_CONFIGURATION_PATTERN)
 
 
 def has_cache_configuration_pattern(text: str) -> bool:
@@ -33,13 +48,13 @@ def has_cache_configuration_pattern(text: str) -> bool:
 
 
 def has_dependency_pattern(text: str) -> bool:
-    string_pattern = ['requir', 'depend', 'relat', 'order', 'sync', 'compat', 'ensur', 'inherit']
-    return any(word in text.lower() for word in string_pattern)
+    text = text.lower()
+    return any(word in text for word in DEPENDENCY_PATTERN)
 
 
 def has_documentation_pattern(text: str) -> bool:
-    string_pattern = ['doc', 'comment', 'spec', 'licens', 'copyright', 'notic', 'header', 'readm']
-    return any(word in text.lower() for word in string_pattern)
+    text = text.lower()
+    return any(word in text for word in DOCUMENTATION_PATTERN)
 
 
 def has_idempotency_pattern(text: str) -> bool:
@@ -47,15 +62,15 @@ def has_idempotency_pattern(text: str) -> bool:
 
 
 def has_security_pattern(text: str) -> bool:
-    string_pattern = ['vul', 'ssl', 'secr', 'authent', 'password', 'secur', 'cve']
-    return any(word in text.lower() for word in string_pattern)
+    text = text.lower()
+    return any(word in text for word in SECURITY_PATTERN)
 
 
 def has_service_pattern(text: str) -> bool:
-    string_pattern = ['servic', 'server']
-    return any(word in text.lower() for word in string_pattern)
+    text = text.lower()
+    return any(word in text for word in SERVICE_PATTERN)
 
 
 def has_syntax_pattern(text: str) -> bool:
-    string_pattern = ['compil', 'lint', 'warn', 'typo', 'spell', 'indent', 'regex', 'variabl', 'whitespac']
-    return any(word in text.lower() for word in string_pattern)
+    text = text.lower()
+    return any(word in text for word in SYNTAX_PATTERN)